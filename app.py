@@ -7,18 +7,82 @@ bibliographic record metadata to a CSV file with predefined column headings.
 """
 
 import csv
+import functools
+import gzip
+import itertools
+import json
 import logging
 import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple
 
 import flet as ft
+import requests
 from almapipy import AlmaCnxn
+from almapipy.utils import AlmaError
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer lxml (libxml2) for Dublin Core XML parsing; fall back to the stdlib
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Prefer orjson for decoding API responses; fall back to requests' json decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Remember the API key in the OS keyring when available
+try:
+    import keyring
+except ImportError:
+    keyring = None
 
 # Load environment variables
 load_dotenv()
 
+# Dublin Core namespaces used in the anies XML of Alma bib records
+DC_NS = "http://purl.org/dc/elements/1.1/"
+DCTERMS_NS = "http://purl.org/dc/terms/"
+DC_NAMESPACES = {"dc": DC_NS, "dcterms": DCTERMS_NS}
+
+# Keyring service and user name the API key is stored under
+KEYRING_SERVICE = "alma-export"
+KEYRING_USERNAME = "api_key"
+
+# Buffer size for CSV file I/O (1 MiB) - fewer write() syscalls on large exports
+FILE_BUFFER_SIZE = 1 << 20
+
+# Flet colors and icons used by the UI, resolved once at import
+COLOR_BLUE_200 = ft.Colors.BLUE_200
+COLOR_BLUE_700 = ft.Colors.BLUE_700
+COLOR_BLUE_900 = ft.Colors.BLUE_900
+COLOR_GREEN_700 = ft.Colors.GREEN_700
+COLOR_GREY_600 = ft.Colors.GREY_600
+COLOR_GREY_700 = ft.Colors.GREY_700
+COLOR_RED_700 = ft.Colors.RED_700
+ICON_DELETE_OUTLINE = ft.Icons.DELETE_OUTLINE
+ICON_CANCEL = ft.Icons.CANCEL
+ICON_DOWNLOAD = ft.Icons.DOWNLOAD
+ICON_FOLDER_OPEN = ft.Icons.FOLDER_OPEN
+
+
+@functools.lru_cache(maxsize=None)
+def qualified_tag(namespace_uri: str, element: str) -> str:
+    """Return the (cached) Clark-notation tag for a namespaced element."""
+    return f"{{{namespace_uri}}}{element}"
+
+
 # Configure logging
 def setup_logging():
     """Setup comprehensive logging to both file and console."""
@@ -41,16 +105,22 @@ def setup_logging():
         datefmt='%H:%M:%S'
     )
     
+    # File log level (default DEBUG); set ALMA_LOG_LEVEL=INFO to skip the
+    # per-record and per-field debug messages on large exports
+    file_level = logging.getLevelName(os.getenv("ALMA_LOG_LEVEL", "DEBUG").upper())
+    if not isinstance(file_level, int):
+        file_level = logging.DEBUG
+    
     # Setup root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(min(file_level, logging.INFO))
     
     # Clear any existing handlers
     root_logger.handlers.clear()
     
     # File handler (detailed logging)
     file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
+    file_handler.setLevel(file_level)
     file_handler.setFormatter(detailed_formatter)
     root_logger.addHandler(file_handler)
     
@@ -73,16 +143,181 @@ LOG_FILE = setup_logging()
 logger = logging.getLogger(__name__)
 
 
+class AlmaBibCache:
+    """On-disk (SQLite) cache of Alma bibliographic records keyed by MMS ID."""
+    
+    # Cache modes: read and write, serve cached records without storing new
+    # ones, or refresh every record from Alma while still storing the results
+    READ_WRITE = "readWrite"
+    READ_ONLY = "readOnly"
+    WRITE_ONLY = "writeOnly"
+    MODES = (READ_WRITE, READ_ONLY, WRITE_ONLY)
+    
+    # Default cache location and record lifetime (7 days)
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "alma-export", "bibs.sqlite")
+    DEFAULT_TTL = 7 * 24 * 60 * 60
+    
+    def __init__(self, path: str = DEFAULT_PATH, ttl: int = DEFAULT_TTL, mode: str = READ_WRITE):
+        """
+        Open (and create if needed) the bib record cache.
+        
+        Args:
+            path: Path to the SQLite database file
+            ttl: Seconds a cached record stays valid
+            mode: One of MODES - default: READ_WRITE
+        """
+        self.path = path
+        self.ttl = ttl
+        self.mode = mode
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Records are looked up from the fetch thread pool, so share one
+        # connection and serialize access to it
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bibs "
+                "(mms_id TEXT PRIMARY KEY, fetched_at INTEGER, record BLOB)"
+            )
+            # Drop expired records so the database doesn't grow without bound
+            expired = self._conn.execute(
+                "DELETE FROM bibs WHERE fetched_at < ?", (int(time.time()) - ttl,)
+            ).rowcount
+        
+        self.logger.info(f"Bib cache opened: {path} (ttl: {ttl}s, mode: {mode}, "
+                         f"{expired} expired record(s) removed)")
+    
+    def get(self, mms_id: str) -> Optional[Dict]:
+        """
+        Return the cached record for an MMS ID, if present and not expired.
+        
+        Args:
+            mms_id: Cleaned MMS ID
+            
+        Returns:
+            Cached bibliographic record or None
+        """
+        if self.mode == self.WRITE_ONLY:
+            return None
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, record FROM bibs WHERE mms_id = ?", (mms_id,)
+            ).fetchone()
+        
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        return orjson.loads(row[1]) if orjson is not None else json.loads(row[1])
+    
+    def put(self, mms_id: str, bib: Dict) -> None:
+        """
+        Store a record fetched from Alma.
+        
+        Args:
+            mms_id: Cleaned MMS ID
+            bib: Bibliographic record
+        """
+        if self.mode == self.READ_ONLY:
+            return
+        
+        data = orjson.dumps(bib) if orjson is not None else json.dumps(bib).encode("utf-8")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bibs (mms_id, fetched_at, record) VALUES (?, ?, ?)",
+                (mms_id, int(time.time()), data)
+            )
+    
+    def clear(self) -> int:
+        """
+        Delete every cached record.
+        
+        Returns:
+            Number of records deleted
+        """
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM bibs").rowcount
+        self.logger.info(f"Cleared {deleted} record(s) from bib cache")
+        return deleted
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly at a maximum rate."""
+    
+    def __init__(self, max_rate: float):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_rate: Maximum number of calls per second
+        """
+        self.interval = 1.0 / max_rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def set_rate(self, max_rate: float) -> None:
+        """
+        Change the maximum rate for subsequent calls.
+        
+        Args:
+            max_rate: Maximum number of calls per second
+        """
+        with self._lock:
+            self.interval = 1.0 / max_rate
+    
+    def wait(self) -> None:
+        """Block until the caller may make its next call."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class AlmaAPIClient:
     """Client for interacting with the Alma API using almapipy."""
     
-    def __init__(self, api_key: str, region: str = "na"):
+    # Maximum number of in-flight Alma requests (Alma allows ~25 requests/second)
+    MAX_CONCURRENT_REQUESTS = 10
+    
+    # Timeout (seconds) for a single Alma request
+    REQUEST_TIMEOUT = 30
+    
+    # Maximum number of MMS IDs Alma accepts in one bibs request
+    BATCH_SIZE = 100
+    
+    # Marks a cache miss (None is a cached "record not found")
+    _NOT_CACHED = object()
+    
+    # Request rate cap, kept under Alma's per-institution limit (25 requests/second)
+    MAX_REQUESTS_PER_SECOND = 20
+    
+    # When the daily API call allowance reported by Alma drops below this,
+    # slow requests down to LOW_REMAINING_REQUESTS_PER_SECOND
+    LOW_REMAINING_CALLS = 1000
+    LOW_REMAINING_REQUESTS_PER_SECOND = 5
+    
+    # Log retrieval progress every this many records
+    PROGRESS_LOG_INTERVAL = 10
+    
+    # Header of the MMS ID column in an input CSV (e.g. "mms_id", "MMS ID")
+    MMS_ID_HEADER_RE = re.compile(r"mms.*id|id.*mms", re.IGNORECASE)
+    
+    def __init__(self, api_key: str, region: str = "na", bib_cache: Optional[AlmaBibCache] = None):
         """
         Initialize the Alma API client using almapipy.
         
         Args:
             api_key: Alma API key
             region: Alma API region code (na, eu, ap, ca, cn) - default: na (North America)
+            bib_cache: Optional on-disk cache consulted before each Alma request
         """
         self.api_key = api_key
         self.region = "na"
@@ -92,14 +327,115 @@ class AlmaAPIClient:
         # AlmaCnxn expects environment variable ALMA_API_KEY or direct parameter
         self.logger.info(f"Initializing AlmaAPIClient with almapipy for region: {region}")
         self.cnxn = AlmaCnxn(api_key, data_format='json')
+        
+        # almapipy calls requests.get() for every request, opening a new
+        # TCP/TLS connection each time. Route reads through one pooled,
+        # keep-alive session instead, retrying throttled and transient errors.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(20, self.MAX_CONCURRENT_REQUESTS),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+        # Send the key as a header so it never appears in logged URLs
+        self.session.headers.update({
+            "Authorization": f"apikey {api_key}",
+            "Accept": "application/json",
+        })
+        
+        # Shared across the fetch threads so concurrent lookups stay under
+        # Alma's rate limit instead of being throttled with 429 responses
+        self.rate_limiter = RateLimiter(self.MAX_REQUESTS_PER_SECOND)
+        self._low_remaining = False
+        
+        # Cleaned MMS IDs Alma reported as missing, so they are not
+        # re-requested. Found records are only cached on disk (bib_cache), so
+        # a long-lived client doesn't hold every record it has fetched.
+        self._missing_ids: Set[str] = set()
+        self.disk_cache = bib_cache
+        
         self.logger.info(f"AlmaAPIClient initialized successfully")
         self.logger.debug(f"API key length: {len(api_key)} characters")
     
+    def clear_cache(self) -> None:
+        """Forget the MMS IDs Alma reported as missing."""
+        self.logger.debug(f"Clearing {len(self._missing_ids)} cached missing MMS ID(s)")
+        self._missing_ids.clear()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self.session.close()
+        self.logger.debug("AlmaAPIClient session closed")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _read(self, url: str, args: Optional[Dict] = None):
+        """
+        Make an Alma API GET call through the shared session.
+        
+        Mirrors almapipy's Client.read(). Successful JSON responses are
+        decoded with orjson when it is installed; everything else goes
+        through almapipy, which raises AlmaError for API errors.
+        
+        Args:
+            url: Alma API endpoint URL
+            args: Optional query string parameters
+            
+        Returns:
+            Parsed JSON response
+        """
+        params = dict(args or {})
+        params.setdefault('format', 'json')
+        
+        self.rate_limiter.wait()
+        response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
+        
+        remaining = response.headers.get('X-Exl-Api-Remaining')
+        if remaining is not None and remaining.isdigit():
+            self._update_rate(int(remaining))
+        
+        if (orjson is not None and response.ok
+                and response.headers.get('Content-Type', '').startswith('application/json')):
+            return orjson.loads(response.content)
+        return self.cnxn.bibs.catalog.__parse_response__(response)
+    
+    def _update_rate(self, remaining: int) -> None:
+        """
+        Slow requests down while Alma's daily API call allowance is low,
+        and restore the full rate once it has been replenished.
+        
+        Args:
+            remaining: Value of Alma's X-Exl-Api-Remaining response header
+        """
+        low = remaining < self.LOW_REMAINING_CALLS
+        if low == self._low_remaining:
+            return
+        self._low_remaining = low
+        if low:
+            self.rate_limiter.set_rate(self.LOW_REMAINING_REQUESTS_PER_SECOND)
+            self.logger.warning(f"Alma API calls remaining today: {remaining}; limiting requests to "
+                                f"{self.LOW_REMAINING_REQUESTS_PER_SECOND}/second")
+        else:
+            self.rate_limiter.set_rate(self.MAX_REQUESTS_PER_SECOND)
+            self.logger.info(f"Alma API calls remaining today: {remaining}; restoring "
+                             f"{self.MAX_REQUESTS_PER_SECOND} requests/second")
     
     def get_bib_details(self, mms_id: str) -> Optional[Dict]:
         """
         Get detailed bibliographic record using almapipy.
         
+        MMS IDs Alma reported as missing are remembered per client, and
+        records found in the on-disk cache (if any) are not fetched at all.
+        
         Args:
             mms_id: MMS ID of the bibliographic record
             
@@ -109,87 +445,297 @@ class AlmaAPIClient:
         # Clean the MMS ID - remove any whitespace or hidden characters
         mms_id_clean = mms_id.strip()
         
-        self.logger.debug(f"Fetching detailed record for MMS ID: {mms_id_clean}")
+        bib = self._get_cached_bib(mms_id_clean)
+        if bib is not self._NOT_CACHED:
+            return bib
+        
+        self.logger.debug("Fetching detailed record for MMS ID: %s", mms_id_clean)
         
         try:
-            # Use almapipy to get the specific bib record
-            # Pass as a string to get single record
-            response = self.cnxn.bibs.catalog.get(
-                mms_id_clean,
-                # expand="p_avail,e_avail,d_avail"
-            )
+            bib = self._fetch_bib(mms_id_clean)
+        except AlmaError as e:
+            # Alma answered but rejected the ID; remember it as missing
+            self.logger.warning(f"Failed to get detailed record for {mms_id_clean}: {str(e)}")
+            bib = None
+        except Exception as e:
+            # Network or unexpected error - don't cache, so a retry can succeed
+            self.logger.warning(f"Failed to get detailed record for {mms_id_clean}: {str(e)}")
+            return None
+        
+        self._cache_bib(mms_id_clean, bib)
+        return bib
+    
+    def get_bib_details_batch(self, mms_ids: List[str],
+                              should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Optional[Dict]]:
+        """
+        Get detailed bibliographic records for up to BATCH_SIZE MMS IDs.
+        
+        Cached records are reused; the rest are retrieved with a single
+        multi-ID request. If Alma rejects the batch, each of its MMS IDs is
+        fetched individually so one bad ID doesn't lose the others.
+        
+        Args:
+            mms_ids: MMS IDs of the bibliographic records
+            should_stop: Optional callable; once it returns True, no further
+                individual requests are made and unfetched IDs are omitted
             
-            self.logger.debug(f"API response type: {type(response)}")
+        Returns:
+            Dictionary mapping each cleaned MMS ID to its record or None
+            (IDs left unfetched after should_stop are absent)
+        """
+        results: Dict[str, Optional[Dict]] = {}
+        uncached = []
+        for mms_id in mms_ids:
+            mms_id_clean = mms_id.strip()
+            bib = self._get_cached_bib(mms_id_clean)
+            if bib is self._NOT_CACHED:
+                uncached.append(mms_id_clean)
+            else:
+                results[mms_id_clean] = bib
+        
+        if len(uncached) == 1:
+            results[uncached[0]] = self.get_bib_details(uncached[0])
+            return results
+        if not uncached:
+            return results
+        
+        self.logger.debug("Fetching %d detailed records in one request", len(uncached))
+        
+        try:
+            fetched = self._fetch_bibs(uncached)
+        except AlmaError as e:
+            self.logger.warning(f"Batch request for {len(uncached)} records failed, "
+                                f"fetching them individually: {str(e)}")
+            for mms_id_clean in uncached:
+                if should_stop and should_stop():
+                    break
+                results[mms_id_clean] = self.get_bib_details(mms_id_clean)
+            return results
+        except Exception as e:
+            # Network or unexpected error - don't cache, so a retry can succeed
+            self.logger.warning(f"Failed to get detailed records for {len(uncached)} MMS IDs: {str(e)}")
+            for mms_id_clean in uncached:
+                results[mms_id_clean] = None
+            return results
+        
+        for mms_id_clean in uncached:
+            # IDs missing from the response are remembered as missing
+            bib = fetched.get(mms_id_clean)
+            self._cache_bib(mms_id_clean, bib)
+            results[mms_id_clean] = bib
+        return results
+    
+    def _get_cached_bib(self, mms_id_clean: str):
+        """
+        Look up a record in the missing-ID set, then the on-disk cache.
+        
+        Args:
+            mms_id_clean: Cleaned MMS ID of the bibliographic record
             
-            # The response should be a single bib record dict
-            if isinstance(response, dict):
-                # Check if it's a valid bib record
-                if 'mms_id' in response:
-                    self.logger.debug(f"Successfully retrieved record for {mms_id_clean}")
-                    return response
-                # Sometimes it might be wrapped in a bib array
-                elif 'bib' in response:
-                    bibs = response.get("bib", [])
-                    if bibs and len(bibs) > 0:
-                        self.logger.debug(f"Successfully retrieved record from 'bib' array for {mms_id_clean}")
-                        return bibs[0]
-                    else:
-                        self.logger.warning(f"Empty 'bib' array in response for MMS ID: {mms_id_clean}")
-                        return None
+        Returns:
+            Cached record (None if known to be missing), or _NOT_CACHED
+        """
+        if mms_id_clean in self._missing_ids:
+            self.logger.debug("MMS ID known to be missing: %s", mms_id_clean)
+            return None
+        
+        if self.disk_cache is not None:
+            bib = self.disk_cache.get(mms_id_clean)
+            if bib is not None:
+                self.logger.debug("Using disk-cached record for MMS ID: %s", mms_id_clean)
+                return bib
+        
+        return self._NOT_CACHED
+    
+    def _cache_bib(self, mms_id_clean: str, bib: Optional[Dict]) -> None:
+        """Remember a fetched record (or None if Alma has no such record)."""
+        if bib is None:
+            self._missing_ids.add(mms_id_clean)
+        elif self.disk_cache is not None:
+            self.disk_cache.put(mms_id_clean, bib)
+    
+    def _fetch_bib(self, mms_id_clean: str) -> Optional[Dict]:
+        """
+        Fetch a single bibliographic record from Alma, bypassing the cache.
+        
+        Args:
+            mms_id_clean: Cleaned MMS ID of the bibliographic record
+            
+        Returns:
+            Detailed bibliographic record or None
+        """
+        # Get the specific bib record from the almapipy bibs endpoint
+        response = self._read(
+            f"{self.cnxn.bibs.catalog.cnxn_params['api_uri_full']}/{mms_id_clean}",
+            # {"expand": "p_avail,e_avail,d_avail"}
+        )
+        
+        self.logger.debug("API response type: %s", type(response))
+        
+        # The response should be a single bib record dict
+        if isinstance(response, dict):
+            # Check if it's a valid bib record
+            if 'mms_id' in response:
+                self.logger.debug("Successfully retrieved record for %s", mms_id_clean)
+                return response
+            # Sometimes it might be wrapped in a bib array
+            elif 'bib' in response:
+                bibs = response.get("bib", [])
+                if bibs and len(bibs) > 0:
+                    self.logger.debug("Successfully retrieved record from 'bib' array for %s", mms_id_clean)
+                    return bibs[0]
                 else:
-                    self.logger.warning(f"Unexpected response structure for {mms_id_clean}: {list(response.keys())}")
+                    self.logger.warning(f"Empty 'bib' array in response for MMS ID: {mms_id_clean}")
                     return None
             else:
-                self.logger.warning(f"Response is not a dict for {mms_id_clean}: {type(response)}")
+                self.logger.warning(f"Unexpected response structure for {mms_id_clean}: {list(response.keys())}")
                 return None
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to get detailed record for {mms_id_clean}: {str(e)}")
+        else:
+            self.logger.warning(f"Response is not a dict for {mms_id_clean}: {type(response)}")
             return None
     
-    def get_bibs_from_mms_ids(self, mms_ids: List[str], progress_callback=None) -> List[Dict]:
+    def _fetch_bibs(self, mms_ids_clean: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch several bibliographic records from Alma in one request,
+        bypassing the cache.
+        
+        Args:
+            mms_ids_clean: Up to BATCH_SIZE cleaned MMS IDs
+            
+        Returns:
+            Dictionary mapping MMS IDs to the records Alma returned
+        """
+        response = self._read(
+            self.cnxn.bibs.catalog.cnxn_params['api_uri_full'],
+            {"mms_id": ",".join(mms_ids_clean)}
+        )
+        
+        if not isinstance(response, dict):
+            self.logger.warning(f"Response is not a dict for batch of {len(mms_ids_clean)} MMS IDs: {type(response)}")
+            return {}
+        
+        bibs = response.get("bib") or []
+        if isinstance(bibs, dict):
+            bibs = [bibs]
+        self.logger.debug("Retrieved %d of %d records in batch", len(bibs), len(mms_ids_clean))
+        return {bib.get("mms_id"): bib for bib in bibs}
+    
+    def get_bibs_from_mms_ids(self, mms_ids: List[str], progress_callback=None,
+                              max_workers: Optional[int] = None) -> List[Dict]:
         """
         Retrieve bibliographic records for a list of MMS IDs.
         
         Args:
             mms_ids: List of MMS IDs to retrieve
             progress_callback: Optional callback function(current, total) for progress updates
+            max_workers: Maximum number of concurrent requests (default: MAX_CONCURRENT_REQUESTS)
             
         Returns:
             List of bibliographic records
         """
-        self.logger.info(f"Starting retrieval of {len(mms_ids)} bibliographic records by MMS ID")
+        return list(self.iter_bibs_from_mms_ids(mms_ids, progress_callback, max_workers))
+    
+    def iter_bibs_from_mms_ids(self, mms_ids: List[str], progress_callback=None,
+                               max_workers: Optional[int] = None,
+                               should_stop: Optional[Callable[[], bool]] = None) -> Iterator[Dict]:
+        """
+        Retrieve bibliographic records for a list of MMS IDs, yielding each
+        record as soon as it (and every record before it) has arrived.
+        
+        Records are fetched BATCH_SIZE at a time with Alma's multi-ID bibs
+        request, and batches are fetched concurrently on a bounded thread
+        pool, since each lookup is a blocking, network-bound HTTP request.
+        Only a small window of batches is in flight at a time, and the client
+        keeps no reference to a record once it is yielded (only the IDs Alma
+        reported missing), so the records held in memory do not grow with
+        the number of MMS IDs. Duplicate MMS IDs are fetched once, and
+        records are yielded in first-seen input order.
+        
+        Args:
+            mms_ids: List of MMS IDs to retrieve
+            progress_callback: Optional callback function(current, total) for progress updates
+            max_workers: Maximum number of concurrent requests (default: MAX_CONCURRENT_REQUESTS)
+            should_stop: Optional callable checked before each MMS ID; once it
+                returns True, retrieval stops and queued requests are cancelled
+            
+        Yields:
+            Bibliographic records
+        """
+        # Drop duplicate MMS IDs, preserving order
+        unique_ids = list(dict.fromkeys(mms_id.strip() for mms_id in mms_ids))
+        if len(unique_ids) < len(mms_ids):
+            self.logger.info(f"Skipping {len(mms_ids) - len(unique_ids)} duplicate MMS ID(s)")
+        mms_ids = unique_ids
         
-        all_bibs = []
-        failed_ids = []
         total = len(mms_ids)
+        max_workers = max_workers or self.MAX_CONCURRENT_REQUESTS
+        batch_size = self.BATCH_SIZE
+        batches = [mms_ids[start:start + batch_size] for start in range(0, total, batch_size)]
+        self.logger.info(f"Starting retrieval of {total} bibliographic records by MMS ID "
+                         f"({len(batches)} batch(es), {max_workers} concurrent requests)")
+        
+        if self._low_remaining:
+            self.logger.warning("Alma API calls remaining today are low; limiting requests to "
+                                f"{self.LOW_REMAINING_REQUESTS_PER_SECOND}/second")
         
-        for i, mms_id in enumerate(mms_ids, 1):
-            self.logger.debug(f"Fetching record {i}/{total}: MMS ID {mms_id}")
+        retrieved = 0
+        failed_ids = []
+        log_interval = self.PROGRESS_LOG_INTERVAL
+        next_log = log_interval
+        i = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="alma-fetch") as executor:
+            # Keep a bounded, ordered window of in-flight batches
+            remaining = iter(batches)
+            pending = deque(
+                (batch, executor.submit(self.get_bib_details_batch, batch, should_stop))
+                for batch in itertools.islice(remaining, max_workers * 2)
+            )
             
             try:
-                bib = self.get_bib_details(mms_id.strip())
-                if bib:
-                    all_bibs.append(bib)
-                    if i % 10 == 0:  # Log progress every 10 records
-                        self.logger.info(f"Progress: Retrieved {i}/{total} records")
-                else:
-                    failed_ids.append(mms_id)
-                    self.logger.warning(f"No record found for MMS ID: {mms_id}")
+                while pending:
+                    batch, future = pending.popleft()
+                    next_batch = next(remaining, None)
+                    if next_batch is not None:
+                        pending.append((next_batch, executor.submit(self.get_bib_details_batch, next_batch, should_stop)))
                     
-            except Exception as e:
-                failed_ids.append(mms_id)
-                self.logger.error(f"Failed to retrieve MMS ID {mms_id}: {str(e)}")
-            
-            # Call progress callback after each record
-            if progress_callback:
-                progress_callback(i, total)
-        
-        self.logger.info(f"Retrieval completed. Successfully retrieved: {len(all_bibs)}, Failed: {len(failed_ids)}")
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Failed to retrieve batch of {len(batch)} MMS IDs: {str(e)}")
+                        results = {}
+                    
+                    for mms_id in batch:
+                        if should_stop and should_stop():
+                            self.logger.info(f"Retrieval stopped after {i}/{total} records")
+                            return
+                        i += 1
+                        bib = results.get(mms_id)
+                        if bib:
+                            retrieved += 1
+                        else:
+                            failed_ids.append(mms_id)
+                            self.logger.warning(f"No record found for MMS ID: {mms_id}")
+                        
+                        if i == next_log:  # Log progress every PROGRESS_LOG_INTERVAL records
+                            next_log += log_interval
+                            if bib:
+                                self.logger.info("Progress: Retrieved %d/%d records", i, total)
+                        
+                        # Call progress callback after each record
+                        if progress_callback:
+                            progress_callback(i, total)
+                        
+                        if bib:
+                            yield bib
+            finally:
+                # Don't start queued requests if the consumer stops early
+                for _, future in pending:
+                    future.cancel()
+        
+        self.logger.info(f"Retrieval completed. Successfully retrieved: {retrieved}, Failed: {len(failed_ids)}")
         if failed_ids:
             self.logger.warning(f"Failed MMS IDs: {', '.join(failed_ids[:10])}{'...' if len(failed_ids) > 10 else ''}")
-        
-        return all_bibs
     
     @staticmethod
     def read_mms_ids_from_csv(csv_file_path: str) -> List[str]:
@@ -211,10 +757,10 @@ class AlmaAPIClient:
         mms_ids = []
         
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-                # Read first line to check for headers
-                first_line = csvfile.readline().strip()
-                csvfile.seek(0)
+            with open(csv_file_path, 'r', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as csvfile:
+                # Read first line to check for headers. It is chained back in
+                # front of the reader below, so the file is read in one pass.
+                first_line = csvfile.readline()
                 
                 # Try to detect delimiter (comma, tab, or semicolon)
                 delimiter = ','
@@ -225,8 +771,9 @@ class AlmaAPIClient:
                 
                 logger.debug(f"Using delimiter: {repr(delimiter)}")
                 
-                reader = csv.reader(csvfile, delimiter=delimiter)
+                reader = csv.reader(itertools.chain([first_line], csvfile), delimiter=delimiter)
                 first_row = next(reader)
+                add_mms_id = mms_ids.append
                 
                 # Check if first row looks like a header
                 # (contains text like "mms", "id", or looks non-numeric)
@@ -239,9 +786,9 @@ class AlmaAPIClient:
                 
                 if has_header:
                     # Find MMS_ID column (case insensitive, handle spaces)
+                    header_re = AlmaAPIClient.MMS_ID_HEADER_RE
                     for i, header in enumerate(first_row):
-                        header_lower = header.lower().replace(' ', '')
-                        if 'mms' in header_lower and 'id' in header_lower:
+                        if header_re.search(header.replace(' ', '')):
                             mms_id_col = i
                             logger.info(f"Found MMS ID column: '{header}' at index {i}")
                             break
@@ -250,20 +797,21 @@ class AlmaAPIClient:
                         logger.warning(f"No MMS_ID column found in headers, using first column: '{first_row[0]}'")
                     
                     # Read data rows
+                    col = mms_id_col
                     for row in reader:
-                        if row and len(row) > mms_id_col:
-                            mms_id = row[mms_id_col].strip()
+                        if len(row) > col:
+                            mms_id = row[col].strip()
                             # Skip comments (lines starting with #), empty values, and pure text values
                             if mms_id and not mms_id.startswith('#') and not mms_id.isalpha():
-                                mms_ids.append(mms_id)
+                                add_mms_id(mms_id)
                             elif mms_id.startswith('#'):
-                                logger.debug(f"Skipping comment line: {mms_id[:50]}...")
+                                logger.debug("Skipping comment line: %.50s...", mms_id)
                 else:
                     # First row is data, not header - add it
                     logger.info("No header detected, using first column for MMS IDs")
                     first_val = first_row[0].strip()
                     if first_val and not first_val.startswith('#'):
-                        mms_ids.append(first_val)
+                        add_mms_id(first_val)
                     
                     # Read remaining rows
                     for row in reader:
@@ -271,17 +819,19 @@ class AlmaAPIClient:
                             mms_id = row[0].strip()
                             # Skip comments (lines starting with #)
                             if not mms_id.startswith('#'):
-                                mms_ids.append(mms_id)
+                                add_mms_id(mms_id)
                             else:
-                                logger.debug(f"Skipping comment line: {mms_id[:50]}...")
+                                logger.debug("Skipping comment line: %.50s...", mms_id)
             
             logger.info(f"Successfully read {len(mms_ids)} MMS IDs from CSV file")
             if mms_ids:
-                logger.debug(f"First 5 MMS IDs: {mms_ids[:5]}")
-                logger.debug(f"First MMS ID details - value: '{mms_ids[0]}', length: {len(mms_ids[0])}, repr: {repr(mms_ids[0])}")
-                # Check for any unusual characters
-                for i, mms_id in enumerate(mms_ids[:3]):
-                    logger.debug(f"MMS ID {i}: has_spaces={' ' in mms_id}, has_newline={'\\n' in mms_id}, has_tab={'\\t' in mms_id}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"First 5 MMS IDs: {mms_ids[:5]}")
+                    logger.debug(f"First MMS ID details - value: '{mms_ids[0]}', length: {len(mms_ids[0])}, repr: {repr(mms_ids[0])}")
+                    # Check for any unusual characters
+                    for i, mms_id in enumerate(mms_ids[:3]):
+                        logger.debug("MMS ID %d: has_spaces=%s, has_newline=%s, has_tab=%s",
+                                     i, ' ' in mms_id, '\n' in mms_id, '\t' in mms_id)
             else:
                 logger.warning("No MMS IDs found in file")
             
@@ -325,93 +875,123 @@ class CSVExporter:
         "file_name_2", "file_label_2", "googlesheetsource", "dginfo"
     ]
     
+    # Positions of every column for each heading. Repeated headings
+    # (LCSH, publisher, extent, isPartOf) map to several consecutive columns.
+    COLUMN_POSITIONS: Dict[str, List[int]] = {}
+    for _index, _heading in enumerate(COLUMN_HEADINGS):
+        COLUMN_POSITIONS.setdefault(_heading, []).append(_index)
+    del _index, _heading
+    
+    # Position of the first column for each heading
+    COLUMN_INDEX: Dict[str, int] = {
+        heading: positions[0] for heading, positions in COLUMN_POSITIONS.items()
+    }
+    
+    # Empty values for every column, used to reset a reused row
+    BLANK_ROW = ("",) * len(COLUMN_HEADINGS)
+    
+    # Compression level for .gz exports; low levels are fast and still
+    # shrink the mostly-empty rows several times over
+    GZIP_COMPRESSLEVEL = 3
+    
     @staticmethod
-    def extract_dc_field(record: Dict, element: str, namespace: str = "dc") -> List[str]:
+    def parse_dc_fields(record: Dict) -> Dict[str, List[str]]:
         """
-        Extract data from Dublin Core XML in the anies field.
+        Parse the Dublin Core XML in the anies field of a record.
+        
+        The XML is parsed and walked once per record, grouping the non-empty
+        element values by tag, so each field extraction is a dict lookup.
         
         Args:
             record: Bibliographic record
-            element: DC element name (e.g., 'title', 'creator', 'subject')
-            namespace: Namespace prefix ('dc' or 'dcterms')
             
         Returns:
-            List of values for the specified DC element
+            Dictionary mapping Clark-notation tags to lists of values
+            (empty if the XML is missing or invalid)
         """
-        import xml.etree.ElementTree as ET
+        fields: Dict[str, List[str]] = {}
         
         try:
             anies = record.get("anies", [])
             if not anies:
-                return []
+                return fields
             
             # anies is a list, take the first element (the DC XML)
             dc_xml = anies[0] if isinstance(anies, list) else anies
             
-            # Parse XML
+            # Parse from bytes: lxml rejects str input with an encoding declaration
+            if isinstance(dc_xml, str):
+                dc_xml = dc_xml.encode("utf-8")
             root = ET.fromstring(dc_xml)
             
-            # Define namespaces
-            namespaces = {
-                'dc': 'http://purl.org/dc/elements/1.1/',
-                'dcterms': 'http://purl.org/dc/terms/'
-            }
-            
-            # Find all matching elements
-            values = []
-            tag = f"{{{namespaces[namespace]}}}{element}"
-            for elem in root.findall(f".//{tag}"):
-                if elem.text and elem.text.strip():
-                    values.append(elem.text.strip())
-            
-            if values:
-                CSVExporter.logger.debug(f"Extracted DC {namespace}:{element}: {len(values)} value(s)")
-            return values
+            # Group values of all descendant elements by tag
+            for elem in root.iter():
+                if elem is root:
+                    continue
+                text = elem.text
+                if text:
+                    text = text.strip()
+                    if text:
+                        fields.setdefault(elem.tag, []).append(text)
             
         except Exception as e:
-            CSVExporter.logger.warning(f"Error extracting DC field {namespace}:{element}: {str(e)}")
-            return []
+            CSVExporter.logger.warning(f"Error parsing DC XML for record {record.get('mms_id', 'Unknown')}: {str(e)}")
+        
+        return fields
     
     @staticmethod
-    def extract_custom_field(record: Dict, element: str, namespace_uri: str) -> List[str]:
+    def extract_dc_field(fields: Dict[str, List[str]], element: str, namespace: str = "dc") -> List[str]:
         """
-        Extract data from custom namespace fields in the anies field.
+        Extract data from parsed Dublin Core XML.
         
         Args:
-            record: Bibliographic record
+            fields: Tag-to-values mapping returned by parse_dc_fields
+            element: DC element name (e.g., 'title', 'creator', 'subject')
+            namespace: Namespace prefix ('dc' or 'dcterms')
+            
+        Returns:
+            List of values for the specified DC element
+        """
+        values = fields.get(qualified_tag(DC_NAMESPACES[namespace], element), [])
+        if values:
+            CSVExporter.logger.debug("Extracted DC %s:%s: %d value(s)", namespace, element, len(values))
+        return values
+    
+    @staticmethod
+    def extract_custom_field(fields: Dict[str, List[str]], element: str, namespace_uri: str) -> List[str]:
+        """
+        Extract data from custom namespace fields in parsed DC XML.
+        
+        Args:
+            fields: Tag-to-values mapping returned by parse_dc_fields
             element: Element name
             namespace_uri: Full namespace URI
             
         Returns:
             List of values for the specified element
         """
-        import xml.etree.ElementTree as ET
+        values = fields.get(qualified_tag(namespace_uri, element), [])
+        if values:
+            CSVExporter.logger.debug("Extracted custom field %s: %d value(s)", element, len(values))
+        return values
+    
+    @staticmethod
+    def fill_columns(row: List[str], heading: str, values: List[str]) -> None:
+        """
+        Write values, in order, into the columns that share a heading.
         
-        try:
-            anies = record.get("anies", [])
-            if not anies:
-                return []
-            
-            dc_xml = anies[0] if isinstance(anies, list) else anies
-            root = ET.fromstring(dc_xml)
-            
-            # Find all matching elements
-            values = []
-            tag = f"{{{namespace_uri}}}{element}"
-            for elem in root.findall(f".//{tag}"):
-                if elem.text and elem.text.strip():
-                    values.append(elem.text.strip())
-            
-            if values:
-                CSVExporter.logger.debug(f"Extracted custom field {element}: {len(values)} value(s)")
-            return values
-            
-        except Exception as e:
-            CSVExporter.logger.warning(f"Error extracting custom field {element}: {str(e)}")
-            return []
+        Values beyond the number of matching columns are dropped.
+        
+        Args:
+            row: Row being built by fill_row
+            heading: Column heading (may be repeated in COLUMN_HEADINGS)
+            values: Values to write
+        """
+        for index, value in zip(CSVExporter.COLUMN_POSITIONS[heading], values):
+            row[index] = value
     
     @staticmethod
-    def map_bib_to_csv_row(bib: Dict) -> Dict[str, str]:
+    def map_bib_to_csv_row(bib: Dict) -> List[str]:
         """
         Map a bibliographic record to a CSV row using Dublin Core fields.
         
@@ -419,225 +999,268 @@ class CSVExporter:
             bib: Bibliographic record from Alma API
             
         Returns:
-            Dictionary mapping column headings to values
+            List of values in COLUMN_HEADINGS order
+        """
+        row = list(CSVExporter.BLANK_ROW)
+        CSVExporter.fill_row(row, bib)
+        return row
+    
+    @staticmethod
+    def fill_row(row: List[str], bib: Dict) -> None:
+        """
+        Write a bibliographic record's values into an existing CSV row.
+        
+        Only columns with values are written, so the row must be blank
+        (e.g. reset from BLANK_ROW) before it is filled.
+        
+        Args:
+            row: Blank row with one slot per column in COLUMN_HEADINGS
+            bib: Bibliographic record from Alma API
         """
         mms_id = bib.get("mms_id", "Unknown")
-        CSVExporter.logger.debug(f"Mapping bibliographic record {mms_id} to CSV row")
+        CSVExporter.logger.debug("Mapping bibliographic record %s to CSV row", mms_id)
         
-        row = {heading: "" for heading in CSVExporter.COLUMN_HEADINGS}
+        col = CSVExporter.COLUMN_INDEX
+        
+        # Parse the Dublin Core XML once for all field extractions below
+        dc_fields = CSVExporter.parse_dc_fields(bib)
         
         # Custom namespace URI for Grinnell-specific fields
         grinnell_ns = f"http://alma.exlibrisgroup.com/dc/{bib.get('originating_system', '01GCL_INST')}"
         
         # Basic metadata from top-level fields
-        row["mms_id"] = bib.get("mms_id", "")
-        row["originating_system_id"] = bib.get("originating_system_id", "")
+        row[col["mms_id"]] = bib.get("mms_id", "")
+        row[col["originating_system_id"]] = bib.get("originating_system_id", "")
         
         # Extract Dublin Core fields from XML
         # dc:title
-        titles = CSVExporter.extract_dc_field(bib, "title", "dc")
-        row["dc:title"] = titles[0] if titles else bib.get("title", "")
+        titles = CSVExporter.extract_dc_field(dc_fields, "title", "dc")
+        row[col["dc:title"]] = titles[0] if titles else bib.get("title", "")
         
         # dcterms:alternative (alternative title)
-        alt_titles = CSVExporter.extract_dc_field(bib, "alternative", "dcterms")
-        row["dcterms:alternative"] = "; ".join(alt_titles) if alt_titles else ""
+        alt_titles = CSVExporter.extract_dc_field(dc_fields, "alternative", "dcterms")
+        row[col["dcterms:alternative"]] = "; ".join(alt_titles) if alt_titles else ""
         
         # dc:identifier(s)
-        identifiers = CSVExporter.extract_dc_field(bib, "identifier", "dc")
-        row["dc:identifier"] = "; ".join(identifiers) if identifiers else ""
+        identifiers = CSVExporter.extract_dc_field(dc_fields, "identifier", "dc")
+        row[col["dc:identifier"]] = "; ".join(identifiers) if identifiers else ""
         
         # dcterms:identifier.dcterms:URI (often http://hdl.handle.net/...)
         for identifier in identifiers:
             if identifier.startswith("http://") or identifier.startswith("https://"):
-                row["dcterms:identifier.dcterms:URI"] = identifier
+                row[col["dcterms:identifier.dcterms:URI"]] = identifier
                 break
         
         # dcterms:tableOfContents
-        toc = CSVExporter.extract_dc_field(bib, "tableOfContents", "dcterms")
-        row["dcterms:tableOfContents"] = "; ".join(toc) if toc else ""
+        toc = CSVExporter.extract_dc_field(dc_fields, "tableOfContents", "dcterms")
+        row[col["dcterms:tableOfContents"]] = "; ".join(toc) if toc else ""
         
         # dc:creator
-        creators = CSVExporter.extract_dc_field(bib, "creator", "dc")
-        row["dc:creator"] = "; ".join(creators) if creators else bib.get("author", "")
+        creators = CSVExporter.extract_dc_field(dc_fields, "creator", "dc")
+        row[col["dc:creator"]] = "; ".join(creators) if creators else bib.get("author", "")
         
         # dc:contributor
-        contributors = CSVExporter.extract_dc_field(bib, "contributor", "dc")
-        row["dc:contributor"] = "; ".join(contributors) if contributors else ""
+        contributors = CSVExporter.extract_dc_field(dc_fields, "contributor", "dc")
+        row[col["dc:contributor"]] = "; ".join(contributors) if contributors else ""
         
         # dc:subject and dcterms:subject.dcterms:LCSH (multiple subject columns)
-        subjects = CSVExporter.extract_dc_field(bib, "subject", "dc")
-        subjects += CSVExporter.extract_dc_field(bib, "subject", "dcterms")
+        subjects = (CSVExporter.extract_dc_field(dc_fields, "subject", "dc")
+                    + CSVExporter.extract_dc_field(dc_fields, "subject", "dcterms"))
         if subjects:
-            row["dc:subject"] = subjects[0]
-            # Fill up to 11 additional LCSH columns
-            for i in range(1, min(len(subjects), 12)):
-                # The COLUMN_HEADINGS has multiple "dcterms:subject.dcterms:LCSH" entries
-                # We need to fill them sequentially - they appear at indices 14-24
-                pass  # Will be handled by the column heading structure
+            row[col["dc:subject"]] = subjects[0]
+            # Remaining subjects fill the repeated LCSH columns in order
+            CSVExporter.fill_columns(row, "dcterms:subject.dcterms:LCSH", subjects[1:])
         
         # dc:description
-        descriptions = CSVExporter.extract_dc_field(bib, "description", "dc")
-        row["dc:description"] = "; ".join(descriptions) if descriptions else ""
+        descriptions = CSVExporter.extract_dc_field(dc_fields, "description", "dc")
+        row[col["dc:description"]] = "; ".join(descriptions) if descriptions else ""
         
         # dcterms:provenance
-        provenance = CSVExporter.extract_dc_field(bib, "provenance", "dcterms")
-        row["dcterms:provenance"] = "; ".join(provenance) if provenance else ""
+        provenance = CSVExporter.extract_dc_field(dc_fields, "provenance", "dcterms")
+        row[col["dcterms:provenance"]] = "; ".join(provenance) if provenance else ""
         
         # dcterms:bibliographicCitation
-        citation = CSVExporter.extract_dc_field(bib, "bibliographicCitation", "dcterms")
-        row["dcterms:bibliographicCitation"] = "; ".join(citation) if citation else ""
+        citation = CSVExporter.extract_dc_field(dc_fields, "bibliographicCitation", "dcterms")
+        row[col["dcterms:bibliographicCitation"]] = "; ".join(citation) if citation else ""
         
         # dcterms:abstract
-        abstract = CSVExporter.extract_dc_field(bib, "abstract", "dcterms")
-        row["dcterms:abstract"] = "; ".join(abstract) if abstract else ""
+        abstract = CSVExporter.extract_dc_field(dc_fields, "abstract", "dcterms")
+        row[col["dcterms:abstract"]] = "; ".join(abstract) if abstract else ""
         
         # dcterms:publisher
-        publishers = CSVExporter.extract_dc_field(bib, "publisher", "dcterms")
+        publishers = CSVExporter.extract_dc_field(dc_fields, "publisher", "dcterms")
         if publishers:
-            row["dcterms:publisher"] = publishers[0]
-            if len(publishers) > 1:
-                # There are two dcterms:publisher columns at indices 30-31
-                pass
+            # There are two dcterms:publisher columns
+            CSVExporter.fill_columns(row, "dcterms:publisher", publishers)
         elif bib.get("publisher_const"):
-            row["dcterms:publisher"] = bib.get("publisher_const", "")
+            row[col["dcterms:publisher"]] = bib.get("publisher_const", "")
         
         # dc:date
-        dates = CSVExporter.extract_dc_field(bib, "date", "dc")
-        row["dc:date"] = dates[0] if dates else bib.get("date_of_publication", "")
+        dates = CSVExporter.extract_dc_field(dc_fields, "date", "dc")
+        row[col["dc:date"]] = dates[0] if dates else bib.get("date_of_publication", "")
         
         # dcterms:created
-        created = CSVExporter.extract_dc_field(bib, "created", "dcterms")
-        row["dcterms:created"] = created[0] if created else ""
+        created = CSVExporter.extract_dc_field(dc_fields, "created", "dcterms")
+        row[col["dcterms:created"]] = created[0] if created else ""
         
         # dcterms:issued
-        issued = CSVExporter.extract_dc_field(bib, "issued", "dcterms")
-        row["dcterms:issued"] = issued[0] if issued else bib.get("date_of_publication", "")
+        issued = CSVExporter.extract_dc_field(dc_fields, "issued", "dcterms")
+        row[col["dcterms:issued"]] = issued[0] if issued else bib.get("date_of_publication", "")
         
         # dcterms:dateSubmitted
-        submitted = CSVExporter.extract_dc_field(bib, "dateSubmitted", "dcterms")
-        row["dcterms:dateSubmitted"] = submitted[0] if submitted else ""
+        submitted = CSVExporter.extract_dc_field(dc_fields, "dateSubmitted", "dcterms")
+        row[col["dcterms:dateSubmitted"]] = submitted[0] if submitted else ""
         
         # dcterms:dateAccepted
-        accepted = CSVExporter.extract_dc_field(bib, "dateAccepted", "dcterms")
-        row["dcterms:dateAccepted"] = accepted[0] if accepted else ""
+        accepted = CSVExporter.extract_dc_field(dc_fields, "dateAccepted", "dcterms")
+        row[col["dcterms:dateAccepted"]] = accepted[0] if accepted else ""
         
         # dc:type
-        types = CSVExporter.extract_dc_field(bib, "type", "dc")
-        row["dc:type"] = types[0] if types else ""
+        types = CSVExporter.extract_dc_field(dc_fields, "type", "dc")
+        row[col["dc:type"]] = types[0] if types else ""
         
         # dc:format
-        formats = CSVExporter.extract_dc_field(bib, "format", "dc")
-        row["dc:format"] = formats[0] if formats else ""
+        formats = CSVExporter.extract_dc_field(dc_fields, "format", "dc")
+        row[col["dc:format"]] = formats[0] if formats else ""
         
         # dcterms:extent (can have multiple)
-        extents = CSVExporter.extract_dc_field(bib, "extent", "dcterms")
-        if extents:
-            row["dcterms:extent"] = extents[0]
-            if len(extents) > 1:
-                # Second extent column exists at index 40
-                pass
+        extents = CSVExporter.extract_dc_field(dc_fields, "extent", "dcterms")
+        # There are two dcterms:extent columns
+        CSVExporter.fill_columns(row, "dcterms:extent", extents)
         
         # dcterms:medium
-        medium = CSVExporter.extract_dc_field(bib, "medium", "dcterms")
-        row["dcterms:medium"] = medium[0] if medium else ""
+        medium = CSVExporter.extract_dc_field(dc_fields, "medium", "dcterms")
+        row[col["dcterms:medium"]] = medium[0] if medium else ""
         
         # dcterms:format.dcterms:IMT
         # Note: This might need special handling if it has attributes
         
         # dcterms:type.dcterms:DCMIType
-        dcmi_types = CSVExporter.extract_dc_field(bib, "type", "dcterms")
+        dcmi_types = CSVExporter.extract_dc_field(dc_fields, "type", "dcterms")
         # Could also be in attributes - need to check actual data
         
         # dc:language
-        languages = CSVExporter.extract_dc_field(bib, "language", "dc")
-        row["dc:language"] = "; ".join(languages) if languages else ""
+        languages = CSVExporter.extract_dc_field(dc_fields, "language", "dc")
+        row[col["dc:language"]] = "; ".join(languages) if languages else ""
         
         # dc:relation
-        relations = CSVExporter.extract_dc_field(bib, "relation", "dc")
-        row["dc:relation"] = "; ".join(relations) if relations else ""
+        relations = CSVExporter.extract_dc_field(dc_fields, "relation", "dc")
+        row[col["dc:relation"]] = "; ".join(relations) if relations else ""
         
-        # dcterms:isPartOf (multiple columns: 46-48)
-        ispartof = CSVExporter.extract_dc_field(bib, "isPartOf", "dcterms")
-        if ispartof:
-            row["dcterms:isPartOf"] = ispartof[0]
-            # Additional columns exist but we need exact indices
+        # dcterms:isPartOf (three columns)
+        ispartof = CSVExporter.extract_dc_field(dc_fields, "isPartOf", "dcterms")
+        CSVExporter.fill_columns(row, "dcterms:isPartOf", ispartof)
         
         # dc:coverage
-        coverage = CSVExporter.extract_dc_field(bib, "coverage", "dc")
-        row["dc:coverage"] = "; ".join(coverage) if coverage else ""
+        coverage = CSVExporter.extract_dc_field(dc_fields, "coverage", "dc")
+        row[col["dc:coverage"]] = "; ".join(coverage) if coverage else ""
         
         # dcterms:spatial
-        spatial = CSVExporter.extract_dc_field(bib, "spatial", "dcterms")
-        row["dcterms:spatial"] = "; ".join(spatial) if spatial else ""
+        spatial = CSVExporter.extract_dc_field(dc_fields, "spatial", "dcterms")
+        row[col["dcterms:spatial"]] = "; ".join(spatial) if spatial else ""
         
         # dcterms:temporal
-        temporal = CSVExporter.extract_dc_field(bib, "temporal", "dcterms")
-        row["dcterms:temporal"] = "; ".join(temporal) if temporal else ""
+        temporal = CSVExporter.extract_dc_field(dc_fields, "temporal", "dcterms")
+        row[col["dcterms:temporal"]] = "; ".join(temporal) if temporal else ""
         
         # dc:rights
-        rights = CSVExporter.extract_dc_field(bib, "rights", "dc")
-        row["dc:rights"] = "; ".join(rights) if rights else ""
+        rights = CSVExporter.extract_dc_field(dc_fields, "rights", "dc")
+        row[col["dc:rights"]] = "; ".join(rights) if rights else ""
         
         # dc:source
-        sources = CSVExporter.extract_dc_field(bib, "source", "dc")
-        row["dc:source"] = "; ".join(sources) if sources else ""
+        sources = CSVExporter.extract_dc_field(dc_fields, "source", "dc")
+        row[col["dc:source"]] = "; ".join(sources) if sources else ""
         
         # Custom fields (Grinnell-specific)
         # compoundrelationship
-        compound = CSVExporter.extract_custom_field(bib, "compoundrelationship", grinnell_ns)
-        row["compoundrelationship"] = compound[0] if compound else ""
+        compound = CSVExporter.extract_custom_field(dc_fields, "compoundrelationship", grinnell_ns)
+        row[col["compoundrelationship"]] = compound[0] if compound else ""
         
         # googlesheetsource
-        sheets = CSVExporter.extract_custom_field(bib, "googlesheetsource", grinnell_ns)
-        row["googlesheetsource"] = sheets[0] if sheets else ""
+        sheets = CSVExporter.extract_custom_field(dc_fields, "googlesheetsource", grinnell_ns)
+        row[col["googlesheetsource"]] = sheets[0] if sheets else ""
         
         # dginfo
-        dginfo = CSVExporter.extract_custom_field(bib, "dginfo", grinnell_ns)
-        row["dginfo"] = dginfo[0] if dginfo else ""
+        dginfo = CSVExporter.extract_custom_field(dc_fields, "dginfo", grinnell_ns)
+        row[col["dginfo"]] = dginfo[0] if dginfo else ""
+    
+    @staticmethod
+    def map_records(bibs: Iterable[Dict]) -> Iterator[Tuple[str, Optional[List[str]]]]:
+        """
+        Map records for export, in order, as the iterable produces them.
         
-        return row
+        A single row list is reused for every record: write or copy each
+        row before advancing the iterator.
+        
+        Args:
+            bibs: List or iterable of bibliographic records
+            
+        Returns:
+            Iterator of (mms_id, row) tuples in input order, where row is
+            None for deleted records
+        """
+        blank = CSVExporter.BLANK_ROW
+        row = list(blank)
+        for bib in bibs:
+            mms_id = bib.get("mms_id", "unknown")
+            if CSVExporter.is_record_deleted(bib):
+                yield mms_id, None
+                continue
+            row[:] = blank
+            CSVExporter.fill_row(row, bib)
+            yield mms_id, row
     
     @staticmethod
-    def export_to_csv(bibs: List[Dict], filename: str) -> None:
+    def export_to_csv(bibs: Iterable[Dict], filename: str) -> int:
         """
         Export bibliographic records to CSV.
         Deleted records are written as comment lines (prefixed with #).
         
+        Records may be streamed: each one is mapped and written as soon as
+        the iterable produces it, so the full set never has to be in memory.
+        Filenames ending in .gz are written gzip-compressed.
+        
         Args:
-            bibs: List of bibliographic records
-            filename: Output CSV filename
+            bibs: List or iterable of bibliographic records
+            filename: Output CSV filename (.csv or .csv.gz)
+            
+        Returns:
+            Number of records exported (active and deleted)
         """
-        CSVExporter.logger.info(f"Starting CSV export of {len(bibs)} records to: {filename}")
+        if isinstance(bibs, list):
+            CSVExporter.logger.info(f"Starting CSV export of {len(bibs)} records to: {filename}")
+        else:
+            CSVExporter.logger.info(f"Starting streaming CSV export to: {filename}")
         
         deleted_count = 0
         active_count = 0
         
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=CSVExporter.COLUMN_HEADINGS)
-                writer.writeheader()
+            if filename.endswith('.gz'):
+                csvfile = gzip.open(filename, 'wt', compresslevel=CSVExporter.GZIP_COMPRESSLEVEL,
+                                    encoding='utf-8', newline='')
+            else:
+                csvfile = open(filename, 'w', newline='', encoding='utf-8', buffering=FILE_BUFFER_SIZE)
+            
+            with csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(CSVExporter.COLUMN_HEADINGS)
                 CSVExporter.logger.debug(f"CSV header written with {len(CSVExporter.COLUMN_HEADINGS)} columns")
                 
-                for i, bib in enumerate(bibs, 1):
-                    # Check if record is deleted
-                    is_deleted = CSVExporter.is_record_deleted(bib)
-                    
-                    row = CSVExporter.map_bib_to_csv_row(bib)
-                    
-                    if is_deleted:
+                for i, (mms_id, row) in enumerate(CSVExporter.map_records(bibs), 1):
+                    # Deleted records are not mapped
+                    if row is None:
                         # Write as comment line
-                        mms_id = bib.get("mms_id", "unknown")
-                        comment_line = f"# DELETED RECORD - MMS ID: {mms_id}"
-                        csvfile.write(comment_line + "\n")
+                        csvfile.write(f"# DELETED RECORD - MMS ID: {mms_id}\n")
                         deleted_count += 1
-                        CSVExporter.logger.debug(f"Record {mms_id} marked as deleted")
+                        CSVExporter.logger.debug("Record %s marked as deleted", mms_id)
                     else:
                         # Write normal row
                         writer.writerow(row)
                         active_count += 1
                     
-                    if i % 10 == 0:  # Log progress every 10 records
-                        CSVExporter.logger.debug(f"Exported {i}/{len(bibs)} records")
+                    if i % 500 == 0:  # Log progress every 500 records
+                        CSVExporter.logger.debug("Exported %d records", i)
             
             CSVExporter.logger.info(f"CSV export completed successfully. File size: {os.path.getsize(filename)} bytes")
             CSVExporter.logger.info(f"Active records: {active_count}, Deleted records (commented): {deleted_count}")
@@ -645,6 +1268,8 @@ class CSVExporter:
         except Exception as e:
             CSVExporter.logger.error(f"Failed to export CSV: {str(e)}")
             raise
+        
+        return active_count + deleted_count
     
     @staticmethod
     def is_record_deleted(bib: Dict) -> bool:
@@ -657,10 +1282,10 @@ class CSVExporter:
         Returns:
             True if record is deleted, False otherwise
         """
-        # Check various indicators of deletion
+        # Check various indicators of deletion, cheapest first
         # 1. Check if title contains "Deleted" or is empty/minimal
-        title = bib.get("title", "").lower()
-        if "deleted" in title or title.strip() == "":
+        title = (bib.get("title") or "").strip()
+        if not title or "deleted" in title.casefold():
             return True
         
         # 2. Check record status fields if they exist
@@ -668,19 +1293,19 @@ class CSVExporter:
             return True
         
         # 3. Check if cataloging_level indicates deletion
-        cataloging_level = bib.get("cataloging_level", {})
+        cataloging_level = bib.get("cataloging_level")
         if isinstance(cataloging_level, dict):
-            desc = cataloging_level.get("desc", "").lower()
-            if "deleted" in desc:
+            desc = cataloging_level.get("desc") or ""
+            if "deleted" in desc.casefold():
                 return True
         
         # 4. Check suppress flags (all suppressed might indicate deletion)
-        suppress_publishing = bib.get("suppress_from_publishing", "false").lower()
-        suppress_external = bib.get("suppress_from_external_search", "false").lower()
-        if suppress_publishing == "true" and suppress_external == "true":
-            # Only consider it deleted if also lacks substantial metadata
-            if not bib.get("anies") or len(bib.get("anies", [])) == 0:
-                return True
+        # Only consider it deleted if it also lacks substantial metadata
+        if not bib.get("anies"):
+            return (
+                str(bib.get("suppress_from_publishing", "false")).casefold() == "true"
+                and str(bib.get("suppress_from_external_search", "false")).casefold() == "true"
+            )
         
         return False
 
@@ -688,6 +1313,9 @@ class CSVExporter:
 class AlmaExportApp:
     """Main Flet application class."""
     
+    # Minimum seconds between progress pushes to the page (at most ~20 per second)
+    PROGRESS_UPDATE_INTERVAL = 0.05
+    
     def __init__(self, page: ft.Page):
         """
         Initialize the application.
@@ -705,19 +1333,46 @@ class AlmaExportApp:
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.logger.info("Initializing AlmaExportApp")
         
-        # API client
+        # API client, reused by later exports with the same API key so they
+        # keep its warm connection pool and known-missing MMS IDs
         self.api_client = None
         
+        # On-disk cache of bib records shared by all exports (None if the
+        # cache database can't be opened)
+        try:
+            self.bib_cache = AlmaBibCache()
+        except (OSError, sqlite3.Error) as ex:
+            self.logger.warning(f"Bib cache disabled: {str(ex)}")
+            self.bib_cache = None
+        
+        # Single worker thread for the export pipeline; serializes exports
+        # and keeps blocking reads, API calls and writes off the UI handlers
+        self.export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alma-export")
+        
+        # Set by the Cancel button to stop the running export
+        self.cancel_event = threading.Event()
+        
         # Selected CSV file path
         self.selected_csv_path = None
         
+        # Exports are written to the directory the app was started from
+        self.output_dir = os.getcwd()
+        
+        # Time (time.monotonic) progress was last pushed to the page
+        self._last_progress_update = 0.0
+        
+        # Records processed by the fetcher so far, out of the total
+        self._records_done = 0
+        self._records_total = 0
+        
         # UI Components
         self.api_key_field = ft.TextField(
             label="Alma API Key",
             password=True,
             can_reveal_password=True,
             width=400,
-            hint_text="Enter your Alma API key"
+            hint_text="Enter your Alma API key",
+            on_blur=self.on_api_key_blur
         )
         
         # File picker for CSV input
@@ -735,7 +1390,7 @@ class AlmaExportApp:
         
         self.file_pick_button = ft.ElevatedButton(
             "Select CSV File",
-            icon=ft.Icons.FOLDER_OPEN,
+            icon=ICON_FOLDER_OPEN,
             on_click=lambda _: self.file_picker.pick_files(
                 allowed_extensions=["csv"],
                 dialog_title="Select CSV file with MMS IDs"
@@ -758,16 +1413,35 @@ class AlmaExportApp:
             hint_text="Enter number"
         )
         
+        self.compress_checkbox = ft.Checkbox(
+            label="Compress output (gzip)",
+            value=False
+        )
+        
+        # Bib cache controls
+        self.refresh_cache_checkbox = ft.Checkbox(
+            label="Refresh cached records from Alma",
+            value=False,
+            disabled=self.bib_cache is None
+        )
+        
+        self.clear_cache_button = ft.OutlinedButton(
+            "Clear cache",
+            icon=ICON_DELETE_OUTLINE,
+            on_click=self.on_clear_cache,
+            disabled=self.bib_cache is None
+        )
+        
         self.status_text = ft.Text(
             "",
             size=14,
-            color=ft.Colors.BLUE_700
+            color=COLOR_BLUE_700
         )
         
         self.progress_text = ft.Text(
             "",
             size=12,
-            color=ft.Colors.GREY_700
+            color=COLOR_GREY_700
         )
         
         self.results_text = ft.Text(
@@ -784,10 +1458,19 @@ class AlmaExportApp:
         
         self.export_button = ft.ElevatedButton(
             "Export Records",
-            icon=ft.Icons.DOWNLOAD,
+            icon=ICON_DOWNLOAD,
             on_click=self.export_records
         )
         
+        self.cancel_button = ft.OutlinedButton(
+            "Cancel",
+            icon=ICON_CANCEL,
+            on_click=self.on_cancel_export,
+            visible=False
+        )
+        
+        self.page.on_close = self.on_page_close
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -796,6 +1479,11 @@ class AlmaExportApp:
         env_api_key = os.getenv("ALMA_API_KEY", "")
         if env_api_key:
             self.api_key_field.value = env_api_key
+        else:
+            # Otherwise use the key saved in the keyring by a previous session
+            stored_api_key = self.load_stored_api_key()
+            if stored_api_key:
+                self.api_key_field.value = stored_api_key
         
         # Build the page layout
         self.page.add(
@@ -806,13 +1494,13 @@ class AlmaExportApp:
                             "Alma Digital Title Export to CSV",
                             size=24,
                             weight=ft.FontWeight.BOLD,
-                            color=ft.Colors.BLUE_900
+                            color=COLOR_BLUE_900
                         ),
-                        ft.Divider(height=20, color=ft.Colors.BLUE_200),
+                        ft.Divider(height=20, color=COLOR_BLUE_200),
                         ft.Text(
                             "Load MMS IDs from CSV file and export metadata to CSV",
                             size=14,
-                            color=ft.Colors.GREY_700
+                            color=COLOR_GREY_700
                         ),
                         ft.Container(height=20),
                         self.api_key_field,
@@ -829,12 +1517,26 @@ class AlmaExportApp:
                         ft.Row(
                             [
                                 self.row_limit_field,
-                                ft.Text("(Leave unchecked to process all rows)", size=12, color=ft.Colors.GREY_600),
+                                ft.Text("(Leave unchecked to process all rows)", size=12, color=COLOR_GREY_600),
+                            ],
+                            spacing=10,
+                        ),
+                        self.compress_checkbox,
+                        ft.Row(
+                            [
+                                self.refresh_cache_checkbox,
+                                self.clear_cache_button,
                             ],
                             spacing=10,
                         ),
                         ft.Container(height=10),
-                        self.export_button,
+                        ft.Row(
+                            [
+                                self.export_button,
+                                self.cancel_button,
+                            ],
+                            spacing=10,
+                        ),
                         self.progress_bar,
                         self.progress_text,
                         ft.Container(height=20),
@@ -848,11 +1550,78 @@ class AlmaExportApp:
             )
         )
     
+    def load_stored_api_key(self) -> Optional[str]:
+        """Return the API key saved in the OS keyring, if any."""
+        if keyring is None:
+            return None
+        try:
+            return keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+        except Exception as ex:
+            self.logger.warning(f"Could not read API key from keyring: {str(ex)}")
+            return None
+    
+    def on_api_key_blur(self, e):
+        """Strip the entered API key and save it to (or clear it from) the OS keyring."""
+        api_key = (self.api_key_field.value or "").strip()
+        if api_key != self.api_key_field.value:
+            self.api_key_field.value = api_key
+            self.page.update()
+        
+        if keyring is None:
+            return
+        stored_api_key = self.load_stored_api_key()
+        if not api_key:
+            # A cleared field forgets the saved key
+            if stored_api_key is None:
+                return
+            try:
+                keyring.delete_password(KEYRING_SERVICE, KEYRING_USERNAME)
+                self.logger.info("API key removed from keyring")
+            except Exception as ex:
+                self.logger.warning(f"Could not remove API key from keyring: {str(ex)}")
+            return
+        
+        # Only keys entered by the user are saved, never the one from .env
+        if api_key == stored_api_key or api_key == os.getenv("ALMA_API_KEY", "").strip():
+            return
+        try:
+            keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, api_key)
+            self.logger.info("API key saved to keyring")
+        except Exception as ex:
+            self.logger.warning(f"Could not save API key to keyring: {str(ex)}")
+    
     def on_limit_checkbox_change(self, e):
         """Handle limit checkbox change."""
         self.row_limit_field.disabled = not e.control.value
         self.page.update()
     
+    def on_page_close(self, e):
+        """Release the export worker, API client and bib cache."""
+        self.logger.info("Page closed, releasing resources")
+        self.cancel_event.set()
+        # Let a running export stop at its next MMS ID before its client and
+        # cache are closed underneath it
+        self.export_executor.shutdown(wait=True, cancel_futures=True)
+        if self.api_client is not None:
+            self.api_client.close()
+        if self.bib_cache is not None:
+            self.bib_cache.close()
+    
+    def on_cancel_export(self, e):
+        """Handle cancel button click."""
+        self.logger.info("Export cancellation requested")
+        self.cancel_event.set()
+        self.cancel_button.disabled = True
+        self.status_text.value = "Cancelling export..."
+        self.page.update()
+    
+    def on_clear_cache(self, e):
+        """Handle clear cache button click."""
+        deleted = self.bib_cache.clear()
+        if self.api_client:
+            self.api_client.clear_cache()
+        self.show_info(f"Cleared {deleted} cached record(s)")
+    
     def on_file_picked(self, e: ft.FilePickerResultEvent):
         """Handle file picker result."""
         if e.files:
@@ -885,21 +1654,46 @@ class AlmaExportApp:
             self.show_error("Please select a CSV file with MMS IDs")
             return
         
-        # Initialize API client
-        self.logger.info("Initializing Alma API client")
-        self.api_client = AlmaAPIClient(api_key)
+        # Initialize API client, or reuse the previous export's client
+        if self.api_client is not None and self.api_client.api_key == api_key:
+            self.logger.info("Reusing Alma API client")
+        else:
+            if self.api_client is not None:
+                self.api_client.close()
+            self.logger.info("Initializing Alma API client")
+            self.api_client = AlmaAPIClient(api_key, bib_cache=self.bib_cache)
+        
+        refresh = self.refresh_cache_checkbox.value
+        if refresh:
+            self.api_client.clear_cache()
+        if self.bib_cache is not None:
+            self.bib_cache.mode = AlmaBibCache.WRITE_ONLY if refresh else AlmaBibCache.READ_WRITE
         
         # Show progress
+        self.cancel_event.clear()
         self.progress_bar.visible = True
+        self.cancel_button.visible = True
+        self.cancel_button.disabled = False
         self.export_button.disabled = True
         self.file_pick_button.disabled = True
+        self.clear_cache_button.disabled = True
         self.status_text.value = "Reading MMS IDs from CSV file..."
-        self.status_text.color = ft.Colors.BLUE_700
+        self.status_text.color = COLOR_BLUE_700
         self.results_text.value = ""
         self.page.update()
         
-        start_time = datetime.now()
-        self.logger.info(f"Starting export operation at {start_time}")
+        # Run the export on the background worker so the UI stays responsive
+        self.export_executor.submit(self.run_export)
+    
+    def run_export(self):
+        """
+        Read MMS IDs, retrieve their records and write the CSV export.
+        
+        Runs on the export worker thread submitted by export_records;
+        progress is pushed to the page as records arrive.
+        """
+        start_time = time.perf_counter()
+        self.logger.info(f"Starting export operation at {datetime.now()}")
         
         try:
             # Read MMS IDs from CSV
@@ -928,49 +1722,52 @@ class AlmaExportApp:
             self.logger.info(f"Processing {len(mms_ids)} MMS IDs")
             
             # Update status
-            self.status_text.value = f"Retrieving {len(mms_ids)} records from Alma..."
+            self.status_text.value = f"Retrieving {len(mms_ids)} records from Alma and exporting to CSV..."
             self.progress_bar.value = 0
             self.progress_text.value = "0%"
             self.page.update()
             
-            # Define progress callback
-            def update_progress(current, total):
-                progress = current / total
-                self.progress_bar.value = progress
-                percentage = int(progress * 100)
-                self.progress_text.value = f"{percentage}% ({current}/{total} records)"
-                self.page.update()
+            # Show the first record's progress straight away
+            self._last_progress_update = 0.0
+            self._records_done = 0
+            self._records_total = 0
+            
+            # Generate filename with timestamp, in the output directory
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = os.path.join(self.output_dir, f"alma_export_{timestamp}.csv")
+            if self.compress_checkbox.value:
+                filename += ".gz"
+            self.logger.info(f"Generated output filename: {filename}")
+            
+            # Retrieve bibliographic records with progress updates, streaming
+            # each record into the CSV as soon as it arrives
+            self.logger.info(f"Retrieving and exporting bibliographic records for {len(mms_ids)} MMS IDs")
+            bibs = self.api_client.iter_bibs_from_mms_ids(mms_ids, progress_callback=self.update_progress,
+                                                          should_stop=self.cancel_event.is_set)
+            record_count = CSVExporter.export_to_csv(bibs, filename)
             
-            # Retrieve bibliographic records with progress updates
-            self.logger.info(f"Retrieving bibliographic records for {len(mms_ids)} MMS IDs")
-            bibs = self.api_client.get_bibs_from_mms_ids(mms_ids, progress_callback=update_progress)
+            # Only a fetcher that stopped before its last MMS ID was cancelled;
+            # a Cancel click after that leaves the finished export alone
+            if self.cancel_event.is_set() and (not self._records_total
+                                               or self._records_done < self._records_total):
+                self.logger.info(f"Export cancelled after {record_count} record(s)")
+                os.remove(filename)
+                self.show_info("Export cancelled")
+                return
             
-            if not bibs:
+            if not record_count:
                 self.logger.warning("No records retrieved from Alma")
+                os.remove(filename)
                 self.show_error("No records could be retrieved from Alma")
                 return
             
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"alma_export_{timestamp}.csv"
-            self.logger.info(f"Generated output filename: {filename}")
-            
-            # Update status
-            self.status_text.value = f"Retrieved {len(bibs)} record(s). Exporting to CSV..."
-            self.page.update()
-            
-            # Export to CSV
-            self.logger.info(f"Starting CSV export of {len(bibs)} records")
-            CSVExporter.export_to_csv(bibs, filename)
-            
             # Calculate execution time
-            end_time = datetime.now()
-            execution_time = end_time - start_time
-            self.logger.info(f"Export completed in {execution_time.total_seconds():.2f} seconds")
+            execution_time = time.perf_counter() - start_time
+            self.logger.info(f"Export completed in {execution_time:.2f} seconds")
             
             # Show success
-            success_message = f"Successfully exported {len(bibs)} record(s) to:\n{os.path.abspath(filename)}"
-            self.logger.info(f"Export successful: {os.path.abspath(filename)}")
+            success_message = f"Successfully exported {record_count} record(s) to:\n{filename}"
+            self.logger.info(f"Export successful: {filename}")
             self.show_success(success_message)
             
         except Exception as ex:
@@ -979,25 +1776,49 @@ class AlmaExportApp:
         
         finally:
             self.progress_bar.visible = False
+            self.cancel_button.visible = False
             self.progress_bar.value = 0
             self.progress_text.value = ""
             self.export_button.disabled = False
             self.file_pick_button.disabled = False
+            self.clear_cache_button.disabled = self.bib_cache is None
             self.page.update()
             self.logger.debug("UI reset completed")
     
+    def update_progress(self, current: int, total: int):
+        """
+        Progress callback for the record fetcher, called once per record.
+        
+        Only records the count and checks the clock; the progress controls
+        are updated and pushed to the page by flush_progress every
+        PROGRESS_UPDATE_INTERVAL seconds and on the last record.
+        """
+        self._records_done = current
+        self._records_total = total
+        now = time.monotonic()
+        if current == total or now - self._last_progress_update >= self.PROGRESS_UPDATE_INTERVAL:
+            self._last_progress_update = now
+            self.flush_progress(current, total)
+    
+    def flush_progress(self, current: int, total: int):
+        """Show export progress in the progress bar and text."""
+        progress = current / total
+        self.progress_bar.value = progress
+        self.progress_text.value = f"{int(progress * 100)}% ({current}/{total} records)"
+        self.page.update()
+    
     def show_error(self, message: str):
         """Display error message."""
         self.logger.error(f"Displaying error to user: {message}")
         self.status_text.value = "❌ " + message
-        self.status_text.color = ft.Colors.RED_700
+        self.status_text.color = COLOR_RED_700
         self.page.update()
     
     def show_success(self, message: str):
         """Display success message."""
         self.logger.info(f"Displaying success to user: {message}")
         self.status_text.value = "✅ " + message
-        self.status_text.color = ft.Colors.GREEN_700
+        self.status_text.color = COLOR_GREEN_700
         self.results_text.value = ""
         self.page.update()
     
@@ -1005,7 +1826,7 @@ class AlmaExportApp:
         """Display info message."""
         self.logger.info(f"Displaying info to user: {message}")
         self.status_text.value = "ℹ️ " + message
-        self.status_text.color = ft.Colors.BLUE_700
+        self.status_text.color = COLOR_BLUE_700
         self.results_text.value = ""
         self.page.update()
 